@@ -11,7 +11,7 @@ DEFAULT_WINDOW_HEIGHT = 700
 
 # Image configuration
 SUPPORTED_FORMATS = [
-    ("Image files", "*.jpg *.jpeg *.png *.gif *.bmp *.tiff *.webp"),
+    ("Image files", "*.jpg *.jpeg *.png *.gif *.bmp *.tiff *.tif *.webp"),
     ("JPEG files", "*.jpg *.jpeg"),
     ("PNG files", "*.png"),
     ("GIF files", "*.gif"),
@@ -2,19 +2,160 @@
 Image handling utilities for loading, processing, and managing images.
 """
 
+import importlib
 import os
-from PIL import Image, ImageTk
-from typing import List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from PIL import Image, ImageTk, UnidentifiedImageError
+from typing import Callable, Dict, List, Optional, Tuple
+
+import constants
+
+# OpenCV's resize is faster than Pillow's on moderate downscales; use it
+# when available (see _CV2_MAX_REDUCTION)
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+    np = None
+
+# Number of rendered images kept for fast back-and-forth navigation
+IMAGE_CACHE_SIZE = 8
+
+# Number of mode-converted (palette, CMYK, ...) source images kept in memory
+MODE_CACHE_SIZE = 4
+
+# File extensions accepted by the file dialog filters, e.g. ".jpg"
+_SUPPORTED_EXTENSIONS = frozenset(
+    pattern[1:].lower()
+    for _, patterns in constants.SUPPORTED_FORMATS
+    for pattern in patterns.split()
+    if pattern != "*.*"
+)
+
+# Extension -> (Pillow plugin module, format name). Importing just the
+# matching plugin and restricting Image.open to it avoids Pillow loading
+# every plugin when identifying a file.
+_EXT_TO_PLUGIN = {
+    ".jpg": ("PIL.JpegImagePlugin", "JPEG"),
+    ".jpeg": ("PIL.JpegImagePlugin", "JPEG"),
+    ".png": ("PIL.PngImagePlugin", "PNG"),
+    ".gif": ("PIL.GifImagePlugin", "GIF"),
+    ".bmp": ("PIL.BmpImagePlugin", "BMP"),
+    ".webp": ("PIL.WebPImagePlugin", "WEBP"),
+    ".tif": ("PIL.TiffImagePlugin", "TIFF"),
+    ".tiff": ("PIL.TiffImagePlugin", "TIFF"),
+}
+
+# 8-bit modes that map directly onto a NumPy array
+_ARRAY_MODES = ("L", "RGB", "RGBA")
+
+# Array modes without alpha. With alpha, Pillow premultiplies before
+# filtering, so the array paths would bleed hidden colours into edges.
+_OPAQUE_MODES = ("L", "RGB")
+
+# Largest downscale factor handed to OpenCV. Below 4x Pillow's reducing_gap=2.0
+# has nothing to reduce and cv2 wins even with the array round trip; from 4x
+# on Pillow shrinks by whole factors first and is faster than copying a large
+# image in and out of NumPy.
+_CV2_MAX_REDUCTION = 4
+
+
+def _open_image(file_path: str) -> Image.Image:
+    """
+    Open an image, loading only the Pillow plugin its extension points to.
+    
+    Falls back to Pillow's normal format detection if the targeted plugin
+    is unavailable or does not recognise the file.
+    """
+    plugin = _EXT_TO_PLUGIN.get(os.path.splitext(file_path)[1].lower())
+    if plugin is not None:
+        module_name, format_name = plugin
+        try:
+            importlib.import_module(module_name)
+            return Image.open(file_path, formats=[format_name])
+        except (ImportError, UnidentifiedImageError):
+            pass
+    return Image.open(file_path)
+
+
+def _cv2_resize(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """
+    Downscale an 8-bit image with OpenCV's INTER_AREA filter, falling back
+    to Pillow for images with alpha or large reductions.
+    """
+    if (img.mode not in _OPAQUE_MODES or img.width >= size[0] * _CV2_MAX_REDUCTION or
+            img.height >= size[1] * _CV2_MAX_REDUCTION):
+        return _bicubic_resize(img, size)
+    
+    # Keep pixels as uint8 throughout. np.asarray still copies: Pillow's
+    # __array_interface__ exports the pixels through tobytes().
+    img.load()
+    resized = cv2.resize(np.asarray(img, dtype=np.uint8), size, interpolation=cv2.INTER_AREA)
+    return Image.fromarray(resized, img.mode)
+
+
+def _bicubic_resize(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """Downscale with Pillow's BICUBIC filter, reducing by whole factors first."""
+    return img.resize(size, resample=Image.Resampling.BICUBIC, reducing_gap=2.0)
+
+
+def _pillow_lanczos_resize(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """Downscale with Pillow's LANCZOS filter."""
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+# (cache key, resized image) produced by prepare_image
+PreparedImage = Tuple[tuple, Image.Image]
+
+# (mtime, (width, height), basename) read once per file by load_images
+ImageMetadata = Tuple[float, Tuple[int, int], str]
 
 
 class ImageHandler:
     """Handles image loading, processing, and management operations."""
     
-    def __init__(self):
+    def __init__(self, high_quality_resize: bool = False):
         self.images: List[str] = []
         self.current_index = 0
         self.current_image: Optional[ImageTk.PhotoImage] = None
-        self.original_image: Optional[Image.Image] = None
+        self._meta: Dict[str, ImageMetadata] = {}
+        self._high_quality_resize = high_quality_resize
+        # (path, mtime, target_width, target_height) -> PhotoImage
+        # (PhotoImage, PIL mode it was created with), so recycled photos are
+        # only pasted into with pixels of the same mode
+        self._cache: "OrderedDict[tuple, Tuple[ImageTk.PhotoImage, str]]" = OrderedDict()
+        self._cache_cap = IMAGE_CACHE_SIZE
+        # Same keys, holding PIL images prepared by prefetch_image()
+        self._pil_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._pil_cache_lock = threading.Lock()
+        # (path, mtime) -> (RGB converted image, original size) for images
+        # whose mode needs converting; guarded by _pil_cache_lock as well
+        self._mode_cache: "OrderedDict[tuple, Tuple[Image.Image, Tuple[int, int]]]" = OrderedDict()
+        # (target_width, target_height) -> resize function from _make_resizer
+        self._resizers: "OrderedDict[Tuple[int, int], Callable[[str], Image.Image]]" = OrderedDict()
+    
+    @property
+    def high_quality_resize(self) -> bool:
+        """
+        Whether to downscale with LANCZOS.
+        
+        LANCZOS is sharper but several times slower than BICUBIC with
+        reducing_gap. Changing it drops the resizers and rendered images
+        built with the previous setting.
+        """
+        return self._high_quality_resize
+    
+    @high_quality_resize.setter
+    def high_quality_resize(self, value: bool):
+        if value == self._high_quality_resize:
+            return
+        self._high_quality_resize = value
+        self._cache.clear()
+        with self._pil_cache_lock:
+            self._pil_cache.clear()
+            self._resizers.clear()
     
     def load_images(self, file_paths: List[str]) -> bool:
         """
@@ -27,14 +168,26 @@ class ImageHandler:
             bool: True if images were loaded successfully
         """
         valid_images = []
+        meta = {}
         
         for path in file_paths:
-            if self.is_valid_image(path):
+            # Skip unsupported extensions without touching the disk
+            if os.path.splitext(path)[1].lower() not in _SUPPORTED_EXTENSIONS:
+                continue
+            info = self._read_metadata(path)
+            if info is not None:
                 valid_images.append(path)
+                meta[path] = info
         
         if valid_images:
             self.images = valid_images
             self.current_index = 0
+            self._meta = meta
+            self._cache.clear()
+            with self._pil_cache_lock:
+                self._pil_cache.clear()
+                self._mode_cache.clear()
+                self._resizers.clear()
             return True
         
         return False
@@ -49,15 +202,26 @@ class ImageHandler:
         Returns:
             bool: True if the file is a valid image
         """
+        return self._read_metadata(file_path) is not None
+    
+    def _read_metadata(self, file_path: str) -> Optional[ImageMetadata]:
+        """
+        Read the header of an image file.
+        
+        Returns:
+            Tuple of (mtime, size, filename), or None if Pillow can't open it
+        """
         try:
-            if not os.path.exists(file_path):
-                return False
-            
-            with Image.open(file_path) as img:
-                img.verify()
-            return True
-        except Exception:
-            return False
+            # Opening only parses the header; reading format and size
+            # is enough to know Pillow can handle the file
+            with _open_image(file_path) as img:
+                _ = img.format
+                size = img.size
+            return os.path.getmtime(file_path), size, os.path.basename(file_path)
+        except (UnidentifiedImageError, OSError, Image.DecompressionBombError,
+                ValueError, SyntaxError):
+            # Malformed or oversized files are skipped, not fatal to the selection
+            return None
     
     def get_current_image_path(self) -> Optional[str]:
         """Get the path of the current image."""
@@ -76,7 +240,7 @@ class ImageHandler:
             return "", 0, 0
         
         current_path = self.images[self.current_index]
-        filename = os.path.basename(current_path)
+        filename = self._meta[current_path][2]
         total = len(self.images)
         position = self.current_index + 1
         
@@ -96,32 +260,262 @@ class ImageHandler:
         if not self.images or self.current_index >= len(self.images):
             return None
         
+        photo_image = self.get_cached_image(target_width, target_height)
+        if photo_image is not None:
+            return photo_image
+        
+        prepared = self.prepare_image(self.current_index, target_width, target_height)
+        if prepared is None:
+            return None
+        
+        return self.finalize_image(prepared)
+    
+    def get_cached_image(self, target_width: int, target_height: int) -> Optional[ImageTk.PhotoImage]:
+        """
+        Get the current image from the rendered cache, if it is there.
+        
+        Returns:
+            PhotoImage object or None on a cache miss
+        """
+        if not self.images or self.current_index >= len(self.images):
+            return None
+        
+        key = self._cache_key(self.images[self.current_index], target_width, target_height)
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        
+        self._cache.move_to_end(key)
+        self.current_image = cached[0]
+        return self.current_image
+    
+    def prepare_image(self, index: int, target_width: int, target_height: int) -> Optional[PreparedImage]:
+        """
+        Decode and resize the image at index, without touching Tk.
+        
+        Safe to call from a worker thread. A prefetched result is used if
+        one is ready.
+        
+        Args:
+            index: Index of the image to prepare
+            target_width: Target width for the image
+            target_height: Target height for the image
+            
+        Returns:
+            Tuple of (cache key, resized image) to pass to finalize_image,
+            or None if loading fails
+        """
+        images = self.images
+        if not 0 <= index < len(images):
+            return None
+        
         try:
-            image_path = self.images[self.current_index]
+            image_path = images[index]
+            key = self._cache_key(image_path, target_width, target_height)
+            
+            # Use a prefetched image if one is ready, otherwise render now
+            with self._pil_cache_lock:
+                resized_img = self._pil_cache.pop(key, None)
+            if resized_img is None:
+                resized_img = self._resize_image(image_path, target_width, target_height)
+            
+            return key, resized_img
             
-            # Open and store original image
-            with Image.open(image_path) as img:
-                self.original_image = img.copy()
-                
-                # Calculate resize dimensions maintaining aspect ratio
-                img_width, img_height = img.size
-                ratio = min(target_width / img_width, target_height / img_height)
-                
-                if ratio < 1:  # Only resize if image is larger than target
-                    new_width = int(img_width * ratio)
-                    new_height = int(img_height * ratio)
-                    resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                else:
-                    resized_img = img.copy()
-                
-                # Convert to PhotoImage
-                self.current_image = ImageTk.PhotoImage(resized_img)
-                return self.current_image
-                
         except Exception as e:
             print(f"Error loading image: {e}")
             return None
     
+    def finalize_image(self, prepared: PreparedImage) -> ImageTk.PhotoImage:
+        """
+        Build the Tk image for a prepared image and make it current.
+        
+        Must be called on the Tk main thread.
+        
+        Args:
+            prepared: Result of prepare_image
+            
+        Returns:
+            PhotoImage object
+        """
+        key, resized_img = prepared
+        photo_image = None
+        
+        # Recycle the Tk photo evicted from the cache when it has the right
+        # size and mode, overwriting its pixels instead of allocating a new
+        # one. paste() converts to the photo's mode, so a mismatch would
+        # drop colour or alpha.
+        if key not in self._cache and len(self._cache) >= self._cache_cap:
+            _, (evicted, evicted_mode) = self._cache.popitem(last=False)
+            if (evicted is not self.current_image and evicted_mode == resized_img.mode and
+                    (evicted.width(), evicted.height()) == resized_img.size):
+                evicted.paste(resized_img)
+                photo_image = evicted
+        
+        # Convert to PhotoImage
+        if photo_image is None:
+            photo_image = ImageTk.PhotoImage(resized_img)
+        
+        self.current_image = photo_image
+        self._cache[key] = (photo_image, resized_img.mode)
+        self._cache.move_to_end(key)
+        return self.current_image
+    
+    def read_ahead(self, indices: List[int]):
+        """
+        Ask the OS to start reading the given images into the page cache.
+        
+        The requests for all files are issued before any of them is
+        decoded, so the reads can proceed in parallel. On platforms without
+        posix_fadvise this does nothing and files are read on demand.
+        
+        Args:
+            indices: Indices of the images that will be needed soon
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        
+        images = self.images
+        for index in indices:
+            if not 0 <= index < len(images):
+                continue
+            try:
+                fd = os.open(images[index], os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+    
+    def prefetch_image(self, index: int, target_width: int, target_height: int):
+        """
+        Decode and resize the image at index ahead of time.
+        
+        Safe to call from a worker thread: only PIL work is done here, the
+        Tk PhotoImage is built later by finalize_image on the main thread.
+        
+        Args:
+            index: Index of the image to prefetch
+            target_width: Target width for the image
+            target_height: Target height for the image
+        """
+        images = self.images
+        if not 0 <= index < len(images):
+            return
+        
+        try:
+            image_path = images[index]
+            key = self._cache_key(image_path, target_width, target_height)
+            
+            with self._pil_cache_lock:
+                if key in self._pil_cache or key in self._cache:
+                    return
+            
+            result = self._resize_image(image_path, target_width, target_height)
+            
+            with self._pil_cache_lock:
+                self._pil_cache[key] = result
+                if len(self._pil_cache) > self._cache_cap:
+                    self._pil_cache.popitem(last=False)
+        except Exception:
+            # Prefetch is best effort; errors surface when the image is shown
+            pass
+    
+    def _cache_key(self, image_path: str, target_width: int, target_height: int) -> tuple:
+        """Build the cache key identifying a rendering of an image file."""
+        return image_path, self._meta[image_path][0], target_width, target_height
+    
+    def _resize_image(self, image_path: str, target_width: int, target_height: int) -> Image.Image:
+        """Decode an image and resize it to fit the target dimensions."""
+        return self._get_resizer(target_width, target_height)(image_path)
+    
+    def _get_resizer(self, target_width: int, target_height: int) -> Callable[[str], Image.Image]:
+        """Get (or build) the resize function for a target size."""
+        key = (target_width, target_height)
+        with self._pil_cache_lock:
+            resizer = self._resizers.get(key)
+            if resizer is not None:
+                self._resizers.move_to_end(key)
+                return resizer
+        
+        resizer = self._make_resizer(target_width, target_height)
+        with self._pil_cache_lock:
+            self._resizers[key] = resizer
+            if len(self._resizers) > IMAGE_CACHE_SIZE:
+                self._resizers.popitem(last=False)
+        return resizer
+    
+    def _make_resizer(self, target_width: int, target_height: int) -> Callable[[str], Image.Image]:
+        """
+        Build a function that decodes an image file and fits it to the
+        target size.
+        
+        The draft size and the scaling backend only depend on the target
+        size and the handler settings, so they are chosen once here rather
+        than on every image.
+        """
+        draft_size = (target_width * 2, target_height * 2)
+        
+        # Every image reaching scale() is L/RGB/RGBA (others are converted
+        # first), so the backend only depends on what is installed
+        if self.high_quality_resize:
+            scale = _pillow_lanczos_resize
+        elif cv2 is not None:
+            scale = _cv2_resize
+        else:
+            scale = _bicubic_resize
+        
+        def fit(img: Image.Image) -> Image.Image:
+            # Calculate resize dimensions maintaining aspect ratio
+            img_width, img_height = img.size
+            ratio = min(target_width / img_width, target_height / img_height)
+            
+            if ratio >= 1:  # Only resize if image is larger than target
+                # Loading the pixels keeps the image usable once its file is
+                # closed, and PhotoImage copies them anyway, so no copy() needed
+                img.load()
+                return img
+            
+            return scale(img, (int(img_width * ratio), int(img_height * ratio)))
+        
+        def resize(image_path: str) -> Image.Image:
+            source_key = (image_path, self._meta[image_path][0])
+            
+            # Palette/CMYK images are converted once and reused across resizes
+            with self._pil_cache_lock:
+                converted = self._mode_cache.get(source_key)
+                if converted is not None:
+                    self._mode_cache.move_to_end(source_key)
+            if converted is not None:
+                img, original_size = converted
+                # Only reuse it if it was not drafted below what this size needs
+                if img.size == original_size or (img.width >= draft_size[0] and
+                                                 img.height >= draft_size[1]):
+                    return fit(img)
+            
+            with _open_image(image_path) as img:
+                original_size = img.size
+                
+                # Let JPEG decode at a reduced scale close to the target.
+                # Draft keeps some headroom for the resize filter and is a
+                # no-op for formats that don't support it.
+                img.draft("RGB", draft_size)
+                
+                if img.mode in _ARRAY_MODES:
+                    return fit(img)
+                
+                has_alpha = "transparency" in img.info or "A" in img.getbands()
+                rgb_img = img.convert("RGBA" if has_alpha else "RGB")
+            
+            with self._pil_cache_lock:
+                self._mode_cache[source_key] = (rgb_img, original_size)
+                if len(self._mode_cache) > MODE_CACHE_SIZE:
+                    self._mode_cache.popitem(last=False)
+            
+            return fit(rgb_img)
+        
+        return resize
+    
     def next_image(self) -> bool:
         """
         Move to the next image.
@@ -168,6 +562,6 @@ class ImageHandler:
     
     def get_original_size(self) -> Optional[Tuple[int, int]]:
         """Get the original size of the current image."""
-        if self.original_image:
-            return self.original_image.size
-        return None
\ No newline at end of file
+        if not self.images or self.current_index >= len(self.images):
+            return None
+        return self._meta[self.images[self.current_index]][1]
\ No newline at end of file
@@ -3,9 +3,10 @@ Main image viewer GUI component with navigation and display functionality.
 """
 
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from image_handler import ImageHandler
 import constants
@@ -17,6 +18,18 @@ class ImageViewer:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.image_handler = ImageHandler()
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_futures: List[Future] = []
+        # Frame size the current image was last rendered for
+        self._last_rendered_size: Optional[Tuple[int, int]] = None
+        # Tk id of the queued after_idle render, if any
+        self._pending_display: Optional[str] = None
+        # Background decode of the current image on a single worker; renders
+        # older than _render_gen are skipped or their results discarded
+        self._render_pool = ThreadPoolExecutor(max_workers=1)
+        self._render_future: Optional[Future] = None
+        self._render_gen = 0
+        self._render_target: Optional[Tuple[int, int, int]] = None
         self.setup_window()
         self.create_widgets()
         self.setup_bindings()
@@ -185,6 +198,12 @@ class ImageViewer:
         self.root.bind("<Return>", lambda e: self.next_image())
         self.root.bind("<Control-o>", lambda e: self.open_images())
         
+        # Render right away when a mouse drag inside the app ends (e.g. a
+        # platform size grip) instead of waiting for the debounce. Window
+        # manager border drags don't deliver this event, so they rely on
+        # the debounce.
+        self.root.bind("<ButtonRelease-1>", self.on_button_release)
+        
         # Make window focusable for keyboard events
         self.root.focus_set()
     
@@ -196,8 +215,10 @@ class ImageViewer:
         )
         
         if file_paths:
+            self.cancel_prefetch()
             if self.image_handler.load_images(list(file_paths)):
-                self.update_display()
+                self.invalidate_display()
+                self.schedule_display()
                 self.update_status(f"Loaded {len(file_paths)} images")
                 self.update_navigation_buttons()
             else:
@@ -209,17 +230,40 @@ class ImageViewer:
     def next_image(self):
         """Navigate to the next image."""
         if self.image_handler.next_image():
-            self.update_display()
+            self.invalidate_display()
+            self.schedule_display()
             self.update_navigation_buttons()
             self.update_status("Next image")
     
     def previous_image(self):
         """Navigate to the previous image."""
         if self.image_handler.previous_image():
-            self.update_display()
+            self.invalidate_display()
+            self.schedule_display()
             self.update_navigation_buttons()
             self.update_status("Previous image")
     
+    def invalidate_display(self):
+        """Forget the rendered image and drop any background render in flight."""
+        self._render_gen += 1
+        self._render_target = None
+        self._last_rendered_size = None
+    
+    def schedule_display(self):
+        """
+        Queue a display update for when Tk is idle.
+        
+        Repeated requests before the update runs (e.g. holding an arrow key)
+        collapse into a single render of the latest image.
+        """
+        if self._pending_display is None:
+            self._pending_display = self.root.after_idle(self._do_display)
+    
+    def _do_display(self):
+        """Run the queued display update."""
+        self._pending_display = None
+        self.update_display()
+    
     def update_display(self):
         """Update the image display with current image."""
         if not self.image_handler.has_images():
@@ -238,25 +282,110 @@ class ImageViewer:
             self.root.after(100, self.update_display)
             return
         
-        # Load and display image
-        photo_image = self.image_handler.load_current_image(frame_width, frame_height)
-        
-        if photo_image:
-            self.image_label.configure(image=photo_image, text="")
-            
-            # Update info
-            filename, total, position = self.image_handler.get_current_image_info()
-            self.info_label.configure(text=f"Current: {filename}")
-            self.counter_label.configure(text=f"{position} of {total}")
-            
-            # Update status with image details
-            original_size = self.image_handler.get_original_size()
-            if original_size:
-                self.update_status(f"{filename} - {original_size[0]}×{original_size[1]} pixels")
+        # Nothing to do if the image is already rendered for this size
+        if (frame_width, frame_height) == self._last_rendered_size:
+            # A render started for another size in between is no longer
+            # wanted; drop it and restore the details it replaced
+            if self._render_target is not None:
+                self._render_gen += 1
+                self._render_target = None
+                self.show_image(self.image_handler.current_image, frame_width, frame_height)
+            return
+        
+        # Rendered images are shown straight from the cache
+        photo_image = self.image_handler.get_cached_image(frame_width, frame_height)
+        if photo_image is not None:
+            self._render_gen += 1
+            self._render_target = None
+            self.show_image(photo_image, frame_width, frame_height)
+            return
+        
+        # Already decoding this image for this size
+        index = self.image_handler.current_index
+        target = (index, frame_width, frame_height)
+        if target == self._render_target:
+            return
+        self._render_target = target
+        
+        # Decode and resize on a worker thread; only the Tk conversion
+        # runs on the main thread, once the result is posted back
+        self._render_gen += 1
+        gen = self._render_gen
+        filename = self.image_handler.get_current_image_info()[0]
+        self.update_status(f"Loading {filename}...")
+        
+        images = self.image_handler.images
+        
+        def render():
+            # Superseded while queued behind the previous render
+            if gen != self._render_gen:
+                return
+            prepared = self.image_handler.prepare_image(index, frame_width, frame_height)
+            self.root.after(0, lambda g=gen, p=prepared: self._on_render_ready(
+                g, images, index, p, frame_width, frame_height
+            ))
+        
+        if self._render_future is not None:
+            self._render_future.cancel()
+        self._render_future = self._render_pool.submit(render)
+    
+    def _on_render_ready(self, gen: int, images: List[str], index: int, prepared,
+                         frame_width: int, frame_height: int):
+        """Show a finished background render unless it is no longer current."""
+        if gen != self._render_gen:
+            return
+        # Navigation or a new selection since the render started
+        if images is not self.image_handler.images or index != self.image_handler.current_index:
+            return
+        self._render_target = None
+        
+        if prepared is not None:
+            self.show_image(self.image_handler.finalize_image(prepared), frame_width, frame_height)
         else:
             self.image_label.configure(image="", text="Error loading image")
+            self._last_rendered_size = None
             self.update_status("Error loading current image")
     
+    def show_image(self, photo_image: ImageTk.PhotoImage, frame_width: int, frame_height: int):
+        """Display a rendered image and update the image details."""
+        self.image_label.configure(image=photo_image, text="")
+        self._last_rendered_size = (frame_width, frame_height)
+        
+        # Update info
+        filename, total, position = self.image_handler.get_current_image_info()
+        self.info_label.configure(text=f"Current: {filename}")
+        self.counter_label.configure(text=f"{position} of {total}")
+        
+        # Update status with image details
+        original_size = self.image_handler.get_original_size()
+        if original_size:
+            self.update_status(f"{filename} - {original_size[0]}×{original_size[1]} pixels")
+        
+        self.prefetch_neighbors(frame_width, frame_height)
+    
+    def prefetch_neighbors(self, frame_width: int, frame_height: int):
+        """Prepare the previous and next images in the background."""
+        self.cancel_prefetch()
+        index = self.image_handler.current_index
+        neighbors = [i for i in (index + 1, index - 1) if 0 <= i < len(self.image_handler.images)]
+        if not neighbors:
+            return
+        
+        # Queue the reads for all neighbors at once, then decode them in turn
+        self._prefetch_futures.append(self._prefetch_pool.submit(
+            self.image_handler.read_ahead, neighbors
+        ))
+        for neighbor in neighbors:
+            self._prefetch_futures.append(self._prefetch_pool.submit(
+                self.image_handler.prefetch_image, neighbor, frame_width, frame_height
+            ))
+    
+    def cancel_prefetch(self):
+        """Cancel prefetch tasks that have not started yet."""
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures = []
+    
     def update_navigation_buttons(self):
         """Update the state of navigation buttons."""
         if not self.image_handler.has_images():
@@ -286,7 +415,19 @@ class ImageViewer:
             # Debounce resize events
             if hasattr(self, '_resize_after'):
                 self.root.after_cancel(self._resize_after)
-            self._resize_after = self.root.after(250, self.update_display)
+            self._resize_after = self.root.after(250, self._on_resize_timer)
+    
+    def _on_resize_timer(self):
+        """Render once the debounced resize has settled."""
+        del self._resize_after
+        self.schedule_display()
+    
+    def on_button_release(self, event):
+        """Flush a pending debounced resize as soon as the mouse is released."""
+        if hasattr(self, '_resize_after'):
+            self.root.after_cancel(self._resize_after)
+            del self._resize_after
+            self.schedule_display()
     
     def run(self):
         """Start the application main loop."""